@@ -22,5 +22,4 @@ except ImportError as e:
 setup(
     ext_modules=[CMakeExtension(name='brer.md', sourcedir='src/plugin')],
     cmdclass={"build_ext": CMakeBuild},
-    zip_safe=False
 )
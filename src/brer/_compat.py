@@ -6,28 +6,28 @@ the package.
 
 * Built-in and :py:mod:`collections.abc` containers are not Generic before 3.9.
 * Dataclasses allow tighter control in Python 3.10
+* `orjson <https://github.com/ijl/orjson>`__ is used for JSON, if available.
 
 """
-__all__ = ['Iterable', 'List', 'Mapping', 'MutableMapping', 'dataclass_kw_only', 'dataclass_slots']
+__all__ = ['Iterable', 'List', 'Mapping', 'MutableMapping', 'dataclass_kw_only', 'dataclass_slots',
+           'json_dumps', 'json_loads']
 
 import collections.abc
+import json
 import sys
 import typing
 
 assert sys.version_info.major >= 3
 _T = typing.TypeVar('_T')
 
-if sys.version_info.major > 3 or sys.version_info.minor >= 9:
+if sys.version_info >= (3, 9):
     List: typing.Generic[_T] = list
     """Generic list type."""
-else:
-    from typing import List
-
-if sys.version_info.major > 3 or sys.version_info.minor >= 9:
     Iterable = collections.abc.Iterable
     Mapping = collections.abc.Mapping
     MutableMapping = collections.abc.MutableMapping
 else:
+    from typing import List
     Iterable = typing.Iterable
     Mapping = typing.Mapping
     MutableMapping = typing.MutableMapping
@@ -51,9 +51,53 @@ In Python >= 3.10, the *slots* option to dataclasses will help keep fields
 from accidentally getting added to instances.
 """
 
-if sys.version_info.major > 3 or sys.version_info.minor >= 10:
+if sys.version_info >= (3, 10):
     dataclass_kw_only = {'kw_only': True}
     dataclass_slots = {'slots': True}
 else:
     dataclass_kw_only = {}
     dataclass_slots = {}
+
+
+json_dumps: typing.Callable[[typing.Any], bytes]
+"""Encode a Python object as (indented) JSON bytes.
+
+Uses :py:mod:`orjson`, if available, which is much faster than the standard library
+and encodes straight to bytes. Otherwise, falls back to :py:mod:`json`. The output
+is indented by two spaces either way (the only indentation supported by orjson).
+NumPy scalars (such as sampled targets) are serialized as plain numbers by
+either back end.
+
+NaN and infinity are not valid JSON, and the back ends differ (orjson writes
+``null``; the :py:mod:`json` fallback raises :py:class:`ValueError`), so callers
+must reject non-finite values before encoding. (See
+:py:meth:`brer.run_data.RunData.save_config`.)
+"""
+
+json_loads: typing.Callable[[typing.Union[bytes, str]], typing.Any]
+"""Decode JSON from bytes or str.
+
+Uses :py:mod:`orjson`, if available. Otherwise, falls back to :py:mod:`json`.
+"""
+
+try:
+    import orjson
+except ImportError:
+    import numpy as np
+
+    def _json_default(obj):
+        # Match orjson.OPT_SERIALIZE_NUMPY for scalars. (numpy.float64 is already
+        # a float, but other NumPy types, such as numpy.float32, are not.)
+        if isinstance(obj, np.generic):
+            return obj.item()
+        raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, allow_nan=False, default=_json_default).encode('utf-8')
+
+    json_loads = json.loads
+else:
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    json_loads = orjson.loads
@@ -59,7 +59,7 @@ class DirectoryHelper:
         self._required_parameters = ['ensemble_num', 'iteration', 'phase']
         for required in self._required_parameters:
             if required not in param_dict:
-                raise ValueError('Must define {}'.format(required))
+                raise ValueError(f'Must define {required}')
         self._param_dict = param_dict
 
     def get_dir(self, level: str) -> str:
@@ -82,19 +82,13 @@ class DirectoryHelper:
         if level == 'top':
             return_dir = self._top_dir
         elif level == 'ensemble_num':
-            return_dir = '{}/mem_{}'.format(self._top_dir, pdict['ensemble_num'])
+            return_dir = f"{self._top_dir}/mem_{pdict['ensemble_num']}"
         elif level == 'iteration':
-            return_dir = '{}/mem_{}/{}'.format(self._top_dir,
-                                               pdict['ensemble_num'],
-                                               pdict['iteration'])
+            return_dir = f"{self._top_dir}/mem_{pdict['ensemble_num']}/{pdict['iteration']}"
         elif level == 'phase':
-            return_dir = '{}/mem_{}/{}/{}'.format(self._top_dir,
-                                                  pdict['ensemble_num'],
-                                                  pdict['iteration'],
-                                                  pdict['phase'])
+            return_dir = f"{self._top_dir}/mem_{pdict['ensemble_num']}/{pdict['iteration']}/{pdict['phase']}"
         else:
-            raise ValueError('{} is not a valid directory type for BRER '
-                             'simulations'.format('type'))
+            raise ValueError(f'{level} is not a valid directory type for BRER simulations')
         return return_dir
 
     def build_working_dir(self):
@@ -7,7 +7,7 @@ Support the statistical (re)sampling of target pair distances when beginning a
 BRER iteration.
 """
 import dataclasses
-import json
+import functools
 import os
 import pathlib
 import typing
@@ -17,6 +17,7 @@ from typing import Iterator
 import numpy as np
 
 from ._compat import dataclass_kw_only
+from ._compat import json_loads
 from ._compat import List
 from ._compat import Mapping
 
@@ -128,6 +129,10 @@ class PairDataCollection(Mapping[str, PairData]):
     def create_from(filename: typing.Union[str, os.PathLike, pathlib.Path]):
         """Reads pair data from json file.
 
+        The same file is often read for many RunConfig instances. While the file
+        is unmodified, the decoded JSON is reused instead of parsing the file
+        again, but each call returns a new collection with its own field values.
+
         Parameters
         ----------
         filename :
@@ -135,37 +140,100 @@ class PairDataCollection(Mapping[str, PairData]):
 
 
         """
+        stat = os.stat(filename)
         pairs = []
-        with open(filename, 'r') as fh:
-            for name, obj in json.load(fh).items():
-                kwargs = {}
-                for key, value in obj.items():
-                    if key == 'name':
-                        message = '*name* field is ignored from brer-md 2.0.'
-                        if name == value:
-                            warnings.warn(message, DeprecationWarning)
-                        else:
-                            message += f' Using {name} instead of {value}.'
-                            warnings.warn(message, UserWarning)
+        for name, obj in _read_pairs(os.path.realpath(filename), stat.st_mtime_ns, stat.st_size).items():
+            kwargs = {}
+            for key, value in obj.items():
+                if key == 'name':
+                    message = '*name* field is ignored from brer-md 2.0.'
+                    if name == value:
+                        warnings.warn(message, DeprecationWarning)
                     else:
-                        kwargs[key] = value
-                pairs.append(PairData(name=name, **kwargs))
+                        message += f' Using {name} instead of {value}.'
+                        warnings.warn(message, UserWarning)
+                else:
+                    # Don't share the cached lists with callers.
+                    kwargs[key] = list(value) if isinstance(value, list) else value
+            pairs.append(PairData(name=name, **kwargs))
         return PairDataCollection(*pairs)
 
     def as_dict(self):
-        """Encode the full collection as a single Python dictionary."""
-        return {pair.name: dataclasses.asdict(pair) for pair in self._pairs.values()}
+        """Encode the full collection as a single Python dictionary.
+
+        The field lists are copied (shallowly), so modifying the result does not
+        affect the `PairData`. This is much cheaper than the recursive deep copy
+        of :py:func:`dataclasses.asdict`.
+        """
+        return {
+            pair.name: {
+                'name': pair.name,
+                'bins': list(pair.bins),
+                'distribution': list(pair.distribution),
+                'sites': list(pair.sites)
+            } for pair in self._pairs.values()
+        }
+
+
+@functools.lru_cache(maxsize=8)
+def _read_pairs(path: str, mtime_ns: int, size: int) -> dict:
+    """Decode a pair data file.
+
+    *mtime_ns* and *size* are only part of the cache key, so that a modified
+    file is read again. The result is shared, so callers must not modify it.
+    """
+    with open(path, 'rb') as fh:
+        return json_loads(fh.read())
+
+
+def _cumulative_distribution(pair_data: PairData) -> np.ndarray:
+    """Get the normalized cumulative distribution for the bins of *pair_data*.
+
+    Normalization follows :py:func:`numpy.random.choice` exactly, so that
+    inverting the result with a uniform variate selects the same bin.
+
+    The (read-only) result is cached on *pair_data* the first time it is needed.
+    """
+    cdf = pair_data.__dict__.get('_cdf')
+    if cdf is None:
+        if len(pair_data.distribution) != len(pair_data.bins):
+            raise ValueError(f'Pair {pair_data.name} has a different number of bins and distribution values.')
+        distribution = np.asarray(pair_data.distribution, dtype=float)
+        if distribution.size == 0:
+            raise ValueError(f'Pair {pair_data.name} has an empty distribution.')
+        if not np.all(np.isfinite(distribution)):
+            raise ValueError(f'Pair {pair_data.name} has non-finite distribution values.')
+        if np.any(distribution < 0):
+            raise ValueError(f'Pair {pair_data.name} has negative distribution values.')
+        total = distribution.sum()
+        if not total > 0:
+            raise ValueError(f'Pair {pair_data.name} has a distribution that sums to zero.')
+        normalized = np.divide(distribution, total)
+        cdf = normalized.cumsum()
+        cdf /= cdf[-1]
+        cdf.setflags(write=False)
+        # PairData is frozen, but the cache is not a dataclass field, so it does
+        # not take part in comparison, repr(), or serialization.
+        object.__setattr__(pair_data, '_cdf', cdf)
+    return cdf
+
+
+def _choose_bin(pair_data: PairData, uniform: float):
+    """Choose the bin edge corresponding to a uniform variate in [0, 1)."""
+    return pair_data.bins[_cumulative_distribution(pair_data).searchsorted(uniform, side='right')]
 
 
 def sample(pair_data: PairData):
     """Choose a bin edge according to the probability distribution."""
-    distribution = pair_data.distribution
-    bins = pair_data.bins
-
-    normalized = np.divide(distribution, np.sum(distribution))
-    return np.random.choice(bins, p=normalized)
+    return _choose_bin(pair_data, np.random.random_sample())
 
 
 def sample_all(pairs: PairDataCollection):
-    """Get a mapping of pair names to freshly sampled targets."""
-    return {name: sample(pair) for name, pair in pairs.items()}
+    """Get a mapping of pair names to freshly sampled targets.
+
+    All of the random numbers are drawn with a single call. The global NumPy
+    random stream is consumed exactly as by successive calls to `sample()`, so
+    seeded runs reproduce the same targets.
+    """
+    uniform = np.random.random_sample(len(pairs))
+    return {name: _choose_bin(pair, u) for (name, pair), u in zip(pairs.items(), uniform)}
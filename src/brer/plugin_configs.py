@@ -4,6 +4,7 @@ Each class corresponds to one restraint potential provided by :py:mod`brer.md`.
 Each instance corresponds to one restrained pair in a single simulation phase.
 """
 import dataclasses
+import functools
 import typing
 from abc import ABC
 from abc import abstractmethod
@@ -29,6 +30,16 @@ def _get_workelement() -> typing.Type:
     return WorkElement
 
 
+@functools.lru_cache(maxsize=None)
+def _init_field_names(cls) -> typing.Tuple[str, ...]:
+    """Get the names of the fields accepted by the *cls* initializer.
+
+    Dataclass fields are fixed when the class is defined, so the result can be
+    cached for each class.
+    """
+    return tuple(field.name for field in dataclasses.fields(cls) if field.init)
+
+
 @dataclasses.dataclass
 class PluginConfig(ABC):
     """Abstract class for the BRER potential configurations.
@@ -61,14 +72,12 @@ class PluginConfig(ABC):
         """
         if cls is PluginConfig:
             raise NotImplementedError
-        return cls(**{key: getattr(obj, key) for key in [field.name for field in dataclasses.fields(cls) if
-                                                         field.init] if hasattr(obj, key)})
+        return cls(**{key: getattr(obj, key) for key in _init_field_names(cls) if hasattr(obj, key)})
 
     @create_from.register(dict)
     @classmethod
     def _(cls, obj: dict):
-        return cls(**{key: obj[key] for key in [field.name for field in dataclasses.fields(cls) if
-                                                field.init] if key in obj})
+        return cls(**{key: obj[key] for key in _init_field_names(cls) if key in obj})
 
 
 @dataclasses.dataclass
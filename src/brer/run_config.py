@@ -68,10 +68,9 @@ def get_api_callable(attr: str, modules: typing.Iterable[str]):
         func = functools.partial(_gmxapi_missing, msg=message)
         qualname = ".".join((_gmxapi_missing.__module__, "_gmxapi_missing"))
 
-    report = "Using" \
-             + " ".join((qualname, version)) \
-             + " for {attr}."
-    logging.info(report)
+    # Use the package logger rather than the root logger: logging.info() would
+    # implicitly call logging.basicConfig() at import time.
+    logging.getLogger('BRER').info('Using %s %s for %s.', qualname, version, attr)
     return func
 
 
@@ -180,9 +179,10 @@ class RunConfig:
 
         if not os.path.exists(ensemble_dir):
             raise RuntimeError(f'Ensemble directory {ensemble_dir} does not exist!')
-        self.ens_dir = ensemble_dir
+        # Resolve the ensemble directory before anything changes the working directory.
+        self.ens_dir = os.path.abspath(ensemble_dir)
 
-        # Load the pair data from a json. Use this to set up the run metadata
+        # Load the pair data from a json. Use this to set up the run metadata.
         self.pairs = PairDataCollection.create_from(pairs_json)
         # use the same identifiers for the pairs here as those provided in the pair
         # metadata
@@ -191,12 +191,11 @@ class RunConfig:
         self.__names = tuple(name for name in self.pairs)
         """A list of identifiers of the residue-residue pairs that will be restrained."""
 
-        member_directory = os.path.join(self.ens_dir, f'mem_{ensemble_num}')
-        if not os.path.exists(member_directory):
-            os.mkdir(member_directory)
+        # Paths for this ensemble member are fixed for the life of the RunConfig.
+        self._member_dir = pathlib.Path(self.ens_dir, f'mem_{ensemble_num}')
+        self._member_dir.mkdir(exist_ok=True)
 
-        self.state_json = '{}/mem_{}/state.json'.format(ensemble_dir,
-                                                        ensemble_num)
+        self.state_json = str(self._member_dir / 'state.json')
         # If we're in the middle of a run, load the BRER checkpoint file and continue from
         # the current state.
         if os.path.exists(self.state_json):
@@ -216,23 +215,28 @@ class RunConfig:
         # Logging
         self._logger = logging.getLogger('BRER')
         self._logger.setLevel(logging.DEBUG)
-        # create file handler which logs even debug messages
-        fh = logging.FileHandler('brer{}.log'.format(ensemble_num))
-        fh.setLevel(logging.DEBUG)
-        # create console handler with a higher log level
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.DEBUG)
-        # create formatter and add it to the handlers
+        # create formatter for the handlers
         formatter = logging.Formatter('%(asctime)s:%(name)s:%(levelname)s - %(message)s')
-        fh.setFormatter(formatter)
-        ch.setFormatter(formatter)
-        # add the handlers to the logger
-        self._logger.addHandler(fh)
-        self._logger.addHandler(ch)
-
-        self._logger.info("Initialized the run configuration: {}".format(
-            self.run_data.as_dictionary()))
-        self._logger.info("Names of restraints: {}".format(self.__names))
+        # The 'BRER' logger is shared by every RunConfig in the process. Only add
+        # handlers that are not already installed, so that creating several
+        # RunConfig instances does not duplicate every log record.
+        log_file = os.path.abspath(f'brer{ensemble_num}.log')
+        if not any(isinstance(handler, logging.FileHandler) and handler.baseFilename == log_file
+                   for handler in self._logger.handlers):
+            # create file handler which logs even debug messages
+            fh = logging.FileHandler(log_file)
+            fh.setLevel(logging.DEBUG)
+            fh.setFormatter(formatter)
+            self._logger.addHandler(fh)
+        if not any(type(handler) is logging.StreamHandler for handler in self._logger.handlers):
+            # create console handler with a higher log level
+            ch = logging.StreamHandler()
+            ch.setLevel(logging.DEBUG)
+            ch.setFormatter(formatter)
+            self._logger.addHandler(ch)
+
+        self._logger.info("Initialized the run configuration: %s", self.run_data.as_dictionary())
+        self._logger.info("Names of restraints: %s", self.__names)
 
         # Need to cleanly handle cancelled jobs: write out a checkpoint of the state if
         # the
@@ -261,11 +265,14 @@ class RunConfig:
 
         # One plugin per restraint.
         self.__plugins = []
+        # The general parameters are the same for every restraint, so we only need
+        # to convert them once. Each restraint gets a shallow copy to update.
+        general_params = dataclasses.asdict(self.run_data.general_params)
         # For each pair-wise restraint, populate the plugin with data: both the
         # "general" data and
         # the data unique to that restraint.
         for name in self.__names:
-            pair_params = dataclasses.asdict(self.run_data.general_params)
+            pair_params = dict(general_params)
             pair_params.update(dataclasses.asdict(self.run_data.pair_params[name]))
             new_restraint = plugin_config.create_from(pair_params)
             self.__plugins.append(new_restraint.build_plugin())
@@ -289,116 +296,115 @@ class RunConfig:
             assert len(self.workdirs) == comm_size
             assert self.workdirs[self._rank] == workdir
 
-    def __move_cpt(self):
+    def __move_cpt(self, target_dir: pathlib.Path):
 
-        def safe_copy(src, dst):
-            if not os.path.exists(src):
-                raise RuntimeError('Missing file: {}'.format(src))
-            if os.path.exists(dst):
-                raise RuntimeError('Destination file already exists: {}'.format(dst))
-            size = os.stat(src).st_size
+        def safe_copy(src: pathlib.Path, dst: pathlib.Path, size: int):
+            # The caller has already called stat() on *src* to get *size*.
+            if dst.exists():
+                raise RuntimeError(f'Destination file already exists: {dst}')
             if size == 0:
-                raise RuntimeError('Source file has zero size: {}'.format(src))
-            target_tmp = dst + '.tmp'
+                raise RuntimeError(f'Source file has zero size: {src}')
+            target_tmp = dst.with_name(dst.name + '.tmp')
             try:
-                shutil.copy(src, target_tmp)
+                # mdrun only reads the input checkpoint; it writes new checkpoints to
+                # a fresh file and renames them into place. A hard link therefore
+                # behaves like a copy, without copying the (possibly large) file.
+                # Fall back to a real copy across file systems or where links are
+                # not supported.
+                try:
+                    os.link(src, target_tmp)
+                except OSError:
+                    shutil.copy(src, target_tmp)
             except Exception as e:
-                if os.path.exists(target_tmp):
-                    os.unlink(target_tmp)
+                if target_tmp.exists():
+                    target_tmp.unlink()
                 raise e
             os.rename(target_tmp, dst)
-            assert os.stat(dst).st_size > 0
+            assert dst.stat().st_size > 0
 
         current_iter = int(self.run_data.get('iteration'))
-        ens_num = int(self.run_data.get('ensemble_num'))
         phase: str = self.run_data.get('phase')
 
-        target_dir = os.getcwd()
-        # Check logic implicit in prior revisions.
-        assert os.path.abspath('{}/mem_{}/{}/{}'.format(self.ens_dir,
-                                                        ens_num,
-                                                        current_iter,
-                                                        phase)) == target_dir
-
-        target = os.path.join(target_dir, 'state.cpt')
+        target = target_dir / 'state.cpt'
         # If the cpt already exists, don't overwrite it
-        if os.path.exists(target):
+        if target.exists():
             self._logger.info(
-                "Phase is {} and state.cpt already exists: not moving any files".format(
-                    phase))
+                "Phase is %s and state.cpt already exists: not moving any files", phase)
 
         else:
-            member_dir = '{}/mem_{}'.format(self.ens_dir, ens_num)
+            member_dir = self._member_dir
             prev_iter = current_iter - 1
 
             if phase in ['training', 'convergence']:
                 if prev_iter > -1:
                     # Get the production cpt from previous iteration
-                    source = '{}/{}/production/state.cpt'.format(member_dir, prev_iter)
-                    if not os.path.exists(source):
+                    source = member_dir / str(prev_iter) / 'production' / 'state.cpt'
+                    try:
+                        source_stat = source.stat()
+                    except FileNotFoundError:
                         raise RuntimeError(
-                            'Missing checkpoint file from previous iteration: {}'.format(
-                                source))
-                    safe_copy(source, target)
+                            f'Missing checkpoint file from previous iteration: {source}')
+                    safe_copy(source, target, source_stat.st_size)
 
                 else:
                     pass  # Do nothing. Let mdrun generate the initial checkpoint file.
 
             else:
                 # Get the convergence cpt from current iteration
-                source = '{}/{}/convergence/state.cpt'.format(member_dir, current_iter)
-                if not os.path.exists(source):
-                    self._logger.error(f'os.path.exists({source}) is False! Getting '
-                                       f'directory listing.')
-                    self._logger.error(str(os.listdir(os.path.dirname(source))))
+                source = member_dir / str(current_iter) / 'convergence' / 'state.cpt'
+                try:
+                    source_stat = source.stat()
+                except FileNotFoundError:
+                    self._logger.error('Missing %s. Parent directory contents: %s',
+                                       source, os.listdir(source.parent))
                     raise RuntimeError(
-                        'Missing checkpoint file from convergence phase: {}'.format(
-                            source))
-                safe_copy(source, target)
+                        f'Missing checkpoint file from convergence phase: {source}')
+                safe_copy(source, target, source_stat.st_size)
 
     def __prep_input(self, tpr_file: str = None):
         if tpr_file is None:
             tpr_file = self.tpr
-            # Get the checkpoint file from the previous phase
-            self.__move_cpt()
+            # Get the checkpoint file from the previous phase into the directory in
+            # which this phase will run.
+            workdir = pathlib.Path(self.workdirs[self._rank])
+            assert workdir == self._member_dir / str(self.run_data.get('iteration')) / self.run_data.get('phase')
+            self.__move_cpt(workdir)
         if not os.path.exists(tpr_file):
-            raise RuntimeError('Missing input file: {}'.format(tpr_file))
+            raise RuntimeError(f'Missing input file: {tpr_file}')
         return tpr_file
 
     def __train(self, tpr_file=None, **kwargs):
         for key in ('append_output',):
             if key in kwargs:
-                raise TypeError('Conflicting key word argument. Cannot accept {}.'.format(
-                    key))
+                raise TypeError(f'Conflicting key word argument. Cannot accept {key}.')
 
         # do re-sampling
         targets = sample_all(self.pairs)
-        self._logger.info('New targets: {}'.format(targets))
-        for name in self.__names:
-            self.run_data.set(name=name, target=targets[name])
-
-        # save the new targets to the BRER checkpoint file.
-        self.run_data.save_config(fnm=self.state_json)
+        self._logger.info('New targets: %s', targets)
+        # The new targets are saved to the BRER checkpoint file at the end of run().
+        # If training does not finish, the next attempt re-samples anyway.
+        self.run_data.set_targets(targets)
 
         workdir = self.workdirs[self._rank]
 
         # backup existing checkpoint.
         # TODO: Don't backup the cpt, actually use it!!
-        cpt = '{}/state.cpt'.format(workdir)
+        cpt = os.path.join(workdir, 'state.cpt')
         if os.path.exists(cpt):
             self._logger.warning(
                 'There is a checkpoint file in your current working directory, but you '
                 'are '
                 'training. The cpt will be backed up and the run will start over with '
                 'new targets')
-            shutil.move(cpt, '{}.bak'.format(cpt))
+            shutil.move(cpt, f'{cpt}.bak')
 
         # If this is not the first BRER iteration, grab the checkpoint from the production
         # phase of the last round
         self.__prep_input(tpr_file)
 
-        # Set up a dictionary to go from plugin name -> restraint name
-        sites_to_name = {}
+        # Set up a dictionary to go from plugin name -> restraint name.
+        # Plugins are named for the string representation of their sites.
+        sites_to_name = {str(self.run_data.pair_params[name].sites): name for name in self.__names}
 
         # Build the gmxapi session.
         tpr_list: Sequence[str] = self._tprs
@@ -407,18 +413,13 @@ class RunConfig:
         if len(self.__plugins) == 0:
             warnings.warn('No BRER restraints are being applied! User error?')
         for plugin in self.__plugins:
-            plugin_name = plugin.name
-            for name in self.__names:
-                run_data_sites = "{}".format(self.run_data.get('sites', name=name))
-                if run_data_sites == plugin_name:
-                    sites_to_name[plugin_name] = name
             md.add_dependency(plugin)
         context = _context(md,
                            workdir_list=self.workdirs,
                            communicator=self._communicator)
 
         self._logger.info("=====TRAINING INFO======\n")
-        self._logger.info(f'Working directory: {workdir}')
+        self._logger.info('Working directory: %s', workdir)
 
         # Run it.
         # WARNING: We do not yet handle situations where a rank has no work to do.
@@ -435,24 +436,25 @@ class RunConfig:
         if not hasattr(context, 'potentials'):
             raise RuntimeError('Invalid gmxapi Context: missing "potentials" attribute.')
 
-        for i in range(len(self.__names)):
-            # noinspection PyUnresolvedReferences
-            current_name = sites_to_name[context.potentials[i].name]
+        # noinspection PyUnresolvedReferences
+        if len(context.potentials) < len(self.__names):
+            raise RuntimeError(
+                f'Expected {len(self.__names)} potentials from the gmxapi Context, '
+                f'but found {len(context.potentials)}.')
+        # noinspection PyUnresolvedReferences
+        for potential in context.potentials[:len(self.__names)]:
+            current_name = sites_to_name[potential.name]
             # In the future runs (convergence, production) we need the ABSOLUTE VALUE
             # of alpha.
-            # noinspection PyUnresolvedReferences
-            current_alpha = context.potentials[i].alpha
+            current_alpha = potential.alpha
             if current_alpha == 0.0:
                 raise RuntimeError('Alpha value was constrained to 0.0, which indicates something went wrong')
 
-            # noinspection PyUnresolvedReferences
-            current_target = context.potentials[i].target
+            current_target = potential.target
 
             self.run_data.set(name=current_name, alpha=current_alpha)
             self.run_data.set(name=current_name, target=current_target)
-            self._logger.info("Plugin {}: alpha = {}, target = {}".format(current_name,
-                                                                          current_alpha,
-                                                                          current_target))
+            self._logger.info("Plugin %s: alpha = %s, target = %s", current_name, current_alpha, current_target)
 
         return context
 
@@ -460,8 +462,7 @@ class RunConfig:
 
         for key in ('append_output',):
             if key in kwargs:
-                raise TypeError('Conflicting key word argument. Cannot accept {}.'.format(
-                    key))
+                raise TypeError(f'Conflicting key word argument. Cannot accept {key}.')
 
         self.__prep_input(tpr_file)
 
@@ -472,9 +473,9 @@ class RunConfig:
         for plugin in self.__plugins:
             md.add_dependency(plugin)
 
-        workdir = os.getcwd()
+        workdir = self.workdirs[self._rank]
         self._logger.info("=====CONVERGENCE INFO======\n")
-        self._logger.info(f'Working directory: {workdir}')
+        self._logger.info('Working directory: %s', workdir)
 
         context = _context(md,
                            workdir_list=self.workdirs,
@@ -498,10 +499,8 @@ class RunConfig:
         # noinspection PyUnresolvedReferences
         self.run_data.set(start_time=context.potentials[0].time)
         for name in self.__names:
-            current_alpha = self.run_data.get('alpha', name=name)
-            current_target = self.run_data.get('target', name=name)
-            message = f'Plugin {name}: alpha = {current_alpha}, target = {current_target}'
-            self._logger.info(message)
+            pair_params = self.run_data.pair_params[name]
+            self._logger.info("Plugin %s: alpha = %s, target = %s", name, pair_params.alpha, pair_params.target)
 
         return context
 
@@ -509,12 +508,15 @@ class RunConfig:
 
         for key in ('append_output', 'end_time'):
             if key in kwargs:
-                raise TypeError('Conflicting key word argument. Cannot accept {}.'.format(
-                    key))
+                raise TypeError(f'Conflicting key word argument. Cannot accept {key}.')
 
-        tpr_list = list(self._tprs)
-        tpr_list[self._rank] = self.__prep_input(tpr_file)
-        if tpr_file is not None:
+        tpr = self.__prep_input(tpr_file)
+        if tpr_file is None:
+            # Without a bootstrap TPR, the configured input list is used as-is.
+            tpr_list: Sequence[str] = self._tprs
+        else:
+            tpr_list = list(self._tprs)
+            tpr_list[self._rank] = tpr
             # If bootstrap TPR is provided, we are not continuing from the
             # convergence phase trajectory.
             self.run_data.set(start_time=0.0)
@@ -533,9 +535,9 @@ class RunConfig:
         for plugin in self.__plugins:
             md.add_dependency(plugin)
 
-        workdir = os.getcwd()
+        workdir = self.workdirs[self._rank]
         self._logger.info("=====PRODUCTION INFO======\n")
-        self._logger.info(f'Working directory: {workdir}')
+        self._logger.info('Working directory: %s', workdir)
 
         context = _context(md,
                            workdir_list=self.workdirs,
@@ -563,7 +565,7 @@ class RunConfig:
         if len(start_times) > 0:
             session_start_time = start_times[0]
             if not all(session_start_time == t for t in start_times):
-                self._logger.warning('Potentials report inconsistent start times: '
+                self._logger.warning('Potentials report inconsistent start times: %s',
                                      ', '.join(str(t) for t in start_times))
             assert session_start_time >= start_time
         else:
@@ -574,7 +576,7 @@ class RunConfig:
         if len(end_times) > 0:
             session_end_time = end_times[0]
             if not all(session_end_time == t for t in end_times):
-                self._logger.warning('Potentials report inconsistent end times: '
+                self._logger.warning('Potentials report inconsistent end times: %s',
                                      ', '.join(str(t) for t in end_times))
         else:
             session_end_time = None
@@ -587,13 +589,10 @@ class RunConfig:
             trajectory_time = session_end_time - session_start_time
 
         if trajectory_time is not None:
-            self._logger.info(f"{trajectory_time} ps production phase trajectory segment.")
+            self._logger.info("%s ps production phase trajectory segment.", trajectory_time)
         for name in self.__names:
-            current_alpha = self.run_data.get('alpha', name=name)
-            current_target = self.run_data.get('target', name=name)
-            self._logger.info("Plugin {}: alpha = {}, target = {}".format(name,
-                                                                          current_alpha,
-                                                                          current_target))
+            pair_params = self.run_data.pair_params[name]
+            self._logger.info("Plugin %s: alpha = %s, target = %s", name, pair_params.alpha, pair_params.target)
 
         return context
 
@@ -631,10 +630,10 @@ class RunConfig:
         Example
         -------
         >>> config_params = {
-        ...     "tpr": "{}/topol.tpr".format(data_dir),
+        ...     "tpr": f"{data_dir}/topol.tpr",
         ...     "ensemble_num": 1,
         ...     "ensemble_dir": tmpdir,
-        ...     "pairs_json": "{}/pair_data.json".format(data_dir)
+        ...     "pairs_json": f"{data_dir}/pair_data.json"
         ... }
         >>> rc = RunConfig(**config_params)
         >>> assert rc.run_data.get('phase') == 'training'
@@ -660,7 +659,13 @@ class RunConfig:
             context = self.__converge(tpr_file=tpr_file, **kwargs)
             # TODO(https://github.com/kassonlab/run_brer/issues/18): Investigate for robustness in the case of
             #  batch workflows and MPI-enabled GROMACS.
-            if all(getattr(potential, 'stop_called', True) for potential in context.potentials):
+            # A potential that cannot report *stop_called* has not told us that it
+            # stopped, so the phase must not advance on its behalf.
+            if not all(hasattr(potential, 'stop_called') for potential in context.potentials):
+                self._logger.warning(
+                    'Upgrade `brer` plugin module: convergence potentials do not report '
+                    '*stop_called*, so BRER cannot advance to the production phase.')
+            if all(getattr(potential, 'stop_called', False) for potential in context.potentials):
                 self.run_data.set(phase='production')
         else:
             context = self.__production(tpr_file=tpr_file, **kwargs)
@@ -17,7 +17,8 @@ See Also
 """
 import collections.abc
 import dataclasses
-import json
+import math
+import numbers
 import os
 import pathlib
 import typing
@@ -26,6 +27,8 @@ from dataclasses import dataclass
 from dataclasses import field
 
 from ._compat import dataclass_slots
+from ._compat import json_dumps
+from ._compat import json_loads
 from ._compat import List
 from ._compat import Mapping
 from ._compat import MutableMapping
@@ -104,6 +107,10 @@ class PairParams:
             self.logging_filename = logging_filename
 
 
+_GENERAL_PARAM_NAMES = frozenset(field.name for field in dataclasses.fields(GeneralParams))
+_PAIR_PARAM_NAMES = frozenset(field.name for field in dataclasses.fields(PairParams))
+
+
 class RunData:
     """Store (and manipulate, to a lesser extent) all the metadata for a BRER run.
 
@@ -143,6 +150,8 @@ class RunData:
 
 
     """
+    __slots__ = ('general_params', 'pair_params', '_last_saved')
+
     general_params: GeneralParams
     pair_params: MutableMapping[str, PairParams]
 
@@ -165,6 +174,9 @@ class RunData:
 
         self.general_params = general_params
 
+        self._last_saved: typing.Optional[typing.Tuple[str, bytes]] = None
+        """File name and contents of the most recent save_config()."""
+
     def set(self, name=None, **kwargs):
         """Set either general or pair-specific parameters.
 
@@ -193,23 +205,47 @@ class RunData:
             # If a restraint name is not specified, it is assumed that the parameter is
             # a "general" parameter.
             if not name:
-                if any(field.name == key for field in dataclasses.fields(self.general_params)):
+                if key in _GENERAL_PARAM_NAMES:
                     setattr(self.general_params, key, value)
                     continue
                 else:
-                    if any(field.name == key for field in dataclasses.fields(PairParams)):
+                    if key in _PAIR_PARAM_NAMES:
                         raise ValueError(
                             f'You must provide pair *name* for which to set pair parameter {key}.')
             else:
-                if any(field.name == key for field in dataclasses.fields(self.pair_params[name])):
+                if key in _PAIR_PARAM_NAMES:
                     setattr(self.pair_params[name], key, value)
                     continue
                 else:
-                    if any(field.name == key for field in dataclasses.fields(GeneralParams)):
+                    if key in _GENERAL_PARAM_NAMES:
                         raise ValueError(
                             f'{key} is a general parameter but you have provided a pair name.')
             raise ValueError(f'{key} is not a valid parameter.')
 
+    def set_targets(self, targets: Mapping[str, float]):
+        """Set the *target* parameter for several restraints at once.
+
+        Equivalent to calling ``set(name=name, target=target)`` for each item,
+        but the parameter name is only validated once.
+
+        Parameters
+        ----------
+        targets :
+            New target distances, keyed by restraint name.
+
+        Raises
+        ------
+        KeyError
+            if any name in *targets* is not a known restraint. No targets are
+            updated in this case.
+        """
+        unknown = targets.keys() - self.pair_params.keys()
+        if unknown:
+            raise KeyError(f'Unknown restraint name(s): {", ".join(sorted(unknown))}')
+        pair_params = self.pair_params
+        for name, target in targets.items():
+            pair_params[name].target = target
+
     def get(self, key, *, name=None):
         """Get either a general or a pair-specific parameter.
 
@@ -233,7 +269,7 @@ class RunData:
             try:
                 return getattr(self.general_params, key)
             except AttributeError as e:
-                if hasattr(PairParams, key):
+                if key in _PAIR_PARAM_NAMES:
                     raise ValueError(
                         f'Must specify pair *name* for parameter {key}.')
                 else:
@@ -252,12 +288,10 @@ class RunData:
         matches for the object attributes.
 
         """
-        pair_param_dict = dict(
-            (name, dataclasses.asdict(pair_params)) for name, pair_params in self.pair_params.items())
-
         return {
             'general parameters': dataclasses.asdict(self.general_params),
-            'pair parameters': dict((key, value) for key, value in pair_param_dict.items() if key != 'name')
+            'pair parameters': {name: dataclasses.asdict(pair_params)
+                                for name, pair_params in self.pair_params.items()}
         }
 
     def save_config(self, fnm='state.json'):
@@ -267,9 +301,37 @@ class RunData:
         ----------
         fnm : str, default='state.json'
             Log file for state parameters.
+
+        The file is written under a temporary name and then renamed, so an
+        interrupted write never leaves a truncated *fnm* behind. If the state is
+        unchanged since it was last saved to *fnm*, the file is not rewritten.
+
+        Raises
+        ------
+        ValueError
+            If any numeric parameter is NaN or infinite. (Such values cannot be
+            represented in JSON, so the state could not be restored.)
         """
-        with open(fnm, 'w') as fh:
-            json.dump(self.as_dictionary(), fh, indent=4)
+        state = self.as_dictionary()
+        for params in (state['general parameters'], *state['pair parameters'].values()):
+            for key, value in params.items():
+                if isinstance(value, numbers.Real) and not math.isfinite(value):
+                    raise ValueError(f'Cannot save non-finite value {key}={value} for {params["name"]}.')
+        payload = json_dumps(state)
+        # Compare absolute paths: a relative *fnm* names a different file after chdir().
+        path = os.path.abspath(fnm)
+        if self._last_saved == (path, payload) and os.path.exists(path):
+            return
+        tmp = f'{fnm}.tmp'
+        try:
+            with open(tmp, 'wb') as fh:
+                fh.write(payload)
+        except Exception as e:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise e
+        os.replace(tmp, fnm)
+        self._last_saved = (path, payload)
 
     @typing.overload
     @classmethod
@@ -307,12 +369,13 @@ class RunData:
 
         """
         if isinstance(source, (str, os.PathLike, pathlib.Path)):
-            if not os.path.exists(source):
-                raise ValueError(f'Source file not found: {source}')
-            else:
-                with open(source, 'r') as fh:
-                    data = json.load(fh)
-                return cls.create_from(source=data, ensemble_num=ensemble_num)
+            # Let open() check for existence instead of making a separate stat() call.
+            try:
+                with open(source, 'rb') as fh:
+                    data = json_loads(fh.read())
+            except FileNotFoundError as e:
+                raise ValueError(f'Source file not found: {source}') from e
+            return cls.create_from(source=data, ensemble_num=ensemble_num)
         elif isinstance(source, PairDataCollection):
             # PairParams comes from PairData names and sites and default values.
             pair_params = {name: PairParams(name=name, sites=pair.sites) for name, pair in source.items()}
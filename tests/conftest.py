@@ -24,6 +24,14 @@ def simulation_input():
         yield tpr_file
 
 
+@pytest.fixture(scope='session')
+def simulation_input_copy(simulation_input, tmp_path_factory):
+    """A copy of the test TPR file at a different path, made once per session."""
+    tpr_file = tmp_path_factory.mktemp('simulation_input') / 'tmp.tpr'
+    shutil.copyfile(simulation_input, tpr_file)
+    return tpr_file
+
+
 @pytest.fixture(scope='session')
 def pair_data_file():
     source = files('brer').joinpath('data', 'pair_data.json')
@@ -103,7 +111,7 @@ def _cleandir(remove_tempdir):
         shutil.rmtree(newpath)
 
     def warn():
-        warnings.warn('Temporary directory not removed: {}'.format(newpath))
+        warnings.warn(f'Temporary directory not removed: {newpath}')
 
     if remove_tempdir == 'always':
         callback = remove
@@ -193,7 +201,7 @@ def gmxcli():
     try:
         assert os.access(command, os.X_OK)
     except Exception as E:
-        raise RuntimeError('"{}" is not an executable gmx wrapper program'.format(command)) from E
+        raise RuntimeError(f'"{command}" is not an executable gmx wrapper program') from E
     yield str(command)
 
 
@@ -18,6 +18,6 @@ def test_directory(tmpdir):
                                  {'ensemble_num': 1, 'iteration': 0, 'phase': 'training'})
     dir_helper.build_working_dir()
     dir_helper.change_dir('phase')
-    assert (os.getcwd() == '{}/mem_{}/{}/{}'.format(top_dir, 1, 0, 'training'))
+    assert (os.getcwd() == f'{top_dir}/mem_1/0/training')
 
     os.chdir(my_home)
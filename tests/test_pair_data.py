@@ -2,8 +2,12 @@
 import dataclasses
 import json
 
+import numpy as np
+import pytest
+
 from brer.pair_data import PairData
 from brer.pair_data import PairDataCollection
+from brer.pair_data import sample
 from brer.pair_data import sample_all
 
 
@@ -24,6 +28,18 @@ def test_pair_data_collection(raw_pair_data, pair_data_file):
             assert getattr(pair_data, key) == value
 
     assert pairs == PairDataCollection.create_from(pair_data_file)
+    assert pairs.as_dict() == {name: dataclasses.asdict(pair) for name, pair in pairs.items()}
+    for encoded in pairs.as_dict().values():
+        encoded['bins'].clear()
+    for pair_name, pair_data in pairs.items():
+        assert pair_data.bins == raw_pair_data[pair_name]['bins']
+
+    # Repeated reads of the same file must not share mutable field values.
+    pairs = PairDataCollection.create_from(pair_data_file)
+    for pair in pairs.values():
+        pair.sites.append(-1)
+    for pair_name, pair_data in PairDataCollection.create_from(pair_data_file).items():
+        assert pair_data.sites == raw_pair_data[pair_name]['sites']
 
 
 def test_pair_data_helpers(pair_data_file):
@@ -34,3 +50,24 @@ def test_pair_data_helpers(pair_data_file):
     for pair in pairs:
         assert samples[pair] >= min(pairs[pair].bins)
         assert samples[pair] <= max(pairs[pair].bins)
+
+    # Drawing all samples at once must reproduce the legacy per-pair
+    # np.random.choice() results for the same random state.
+    state = np.random.get_state()
+    samples = sample_all(pairs)
+    np.random.set_state(state)
+    for name, pair in pairs.items():
+        normalized = np.divide(pair.distribution, np.sum(pair.distribution))
+        assert samples[name] == np.random.choice(pair.bins, p=normalized)
+
+
+@pytest.mark.parametrize('distribution', ([], [0., 0., 0.], [1., float('nan'), 1.],
+                                          [1., float('inf'), 1.], [1., -1., 1.]))
+def test_invalid_distribution(distribution):
+    """Sampling must reject distributions that np.random.choice() would reject."""
+    bins = [float(i) for i in range(len(distribution))]
+    pair = PairData(name='invalid', bins=bins, distribution=distribution, sites=[0, 1])
+    with pytest.raises(ValueError):
+        sample(pair)
+    with pytest.raises(ValueError):
+        sample_all(PairDataCollection(pair))
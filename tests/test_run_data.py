@@ -30,13 +30,13 @@ def test_pair_parameters(raw_pair_data):
             assert hasattr(pp, default_param)
 
 
-def test_run_data(tmpdir, raw_pair_data):
+def test_run_data(tmp_path, monkeypatch, raw_pair_data):
     """Test creation of RunData object from PairData objects and check no
     missing keys.
 
     Parameters
     ----------
-    tmpdir : str
+    tmp_path : pathlib.Path
         pytest temporary directory
     raw_pair_data : dict
         raw pair data from conftest.py
@@ -60,18 +60,42 @@ def test_run_data(tmpdir, raw_pair_data):
         rd.get("alpha")
     assert rd.get("alpha", name=name) == 1.
 
+    # Test bulk target updates.
+    targets = {key: float(i) for i, key in enumerate(raw_pair_data)}
+    with pytest.raises(KeyError):
+        rd.set_targets({**targets, 'nonexistent': 1.})
+    assert rd.get("target", name=name) != targets[name]
+    rd.set_targets(targets)
+    for key, target in targets.items():
+        assert rd.get("target", name=key) == target
+
     # Test read/write of the state
-    rd.save_config("{}/state.json".format(tmpdir))
+    rd.save_config(tmp_path / 'state.json')
     modified_rd = rd
     rd = RunData.create_from(pairs)
     assert rd.get("alpha", name=name) != 1.
     assert modified_rd.as_dictionary() != rd.as_dictionary()
 
     # Confirm that the restored data is the same as the original.
-    rd = RunData.create_from("{}/state.json".format(tmpdir))
+    rd = RunData.create_from(tmp_path / 'state.json')
     assert rd.get("alpha", name=name) == 1.
     assert modified_rd.as_dictionary() == rd.as_dictionary()
 
+    # Non-finite values cannot be encoded in JSON and must not corrupt the checkpoint.
+    rd.set(alpha=float('nan'), name=name)
+    with pytest.raises(ValueError, match='non-finite'):
+        rd.save_config(tmp_path / 'state.json')
+    assert RunData.create_from(tmp_path / 'state.json').get("alpha", name=name) == 1.
+    rd.set(alpha=1., name=name)
+
+    # An unchanged state must still be written to a relative path in a new directory.
+    for subdir in ('a', 'b'):
+        (tmp_path / subdir).mkdir()
+        (tmp_path / subdir / 'state.json').write_text('{"stale": true}')
+        monkeypatch.chdir(tmp_path / subdir)
+        rd.save_config('state.json')
+        assert RunData.create_from('state.json').as_dictionary() == rd.as_dictionary()
+
     with tempfile.NamedTemporaryFile(suffix='.json', mode='w') as tmp:
         test_data = raw_pair_data.copy()
         for name in test_data:
@@ -82,6 +106,9 @@ def test_run_data(tmpdir, raw_pair_data):
         # but issues deprecation warning.
         with pytest.deprecated_call():
             PairDataCollection.create_from(tmp.name)
+        # The warning is repeated, even though the file has already been parsed.
+        with pytest.deprecated_call():
+            PairDataCollection.create_from(tmp.name)
 
     with tempfile.NamedTemporaryFile(suffix='.json', mode='w') as tmp:
         test_data = raw_pair_data.copy()